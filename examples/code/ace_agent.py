@@ -4,9 +4,21 @@ ACE Framework Implementation Example
 Demonstrates the Generator-Reflector-Curator cycle programmatically
 """
 
+import copy
+import heapq
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Dict
-from enum import Enum
+from typing import List, Dict, Tuple, Union
+from enum import Enum, IntEnum
+
+
+# Banners printed around each ACE cycle, built once at import time
+_BANNER_START = "\n" + ("🔄" * 30) + "\nACE FRAMEWORK EXECUTION\n" + ("🔄" * 30)
+_BANNER_END = "\n" + ("✅" * 30) + "\nACE CYCLE COMPLETE\n" + ("✅" * 30)
+
+# Column layout shared by the trade-off matrix header and rows
+_ROW_FMT = "{:<15} {:<8} {:<10} {:<10} {:<8} {:<6}".format
 
 
 class Phase(Enum):
@@ -15,15 +27,77 @@ class Phase(Enum):
     CURATOR = "curator"
 
 
-@dataclass
-class Solution:
+class Rating(IntEnum):
+    """Ordinal High/Medium/Low rating used in trade-off analysis"""
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+
+    @property
+    def label(self) -> str:
+        """Display name, e.g. "High" """
+        return self.name.capitalize()
+
+    @classmethod
+    def parse(cls, value) -> "Rating":
+        """Convert a rating such as "High" (e.g. from LLM output) to a Rating"""
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls[str(value).strip().upper()]
+        except KeyError:
+            raise ValueError(
+                f"Unknown rating {value!r}; expected High, Medium or Low"
+            ) from None
+
+
+class _FrozenSlots:
+    """
+    Pickle/copy support for the frozen, hand-slotted dataclasses below
+
+    Slots are declared by hand rather than with dataclass(slots=True) so the
+    example still runs on Python < 3.10 and private caches stay out of fields().
+    Without __dict__, pickle and copy restore state via setattr, which frozen
+    dataclasses reject, so state is written back with object.__setattr__.
+
+    Each subclass's __slots__ must list every field plus its private caches.
+    Fields must not take defaults: a class-level default conflicts with the
+    slot of the same name.
+    """
+    __slots__ = ()
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class Solution(_FrozenSlots):
     """A proposed solution from the Generator phase"""
+    __slots__ = ("name", "description", "implementation_steps", "assumptions", "_rendered")
+
     name: str
     description: str
-    implementation_steps: List[str]
-    assumptions: List[str]
+    implementation_steps: Tuple[str, ...]
+    assumptions: Tuple[str, ...]
+
+    def __post_init__(self):
+        # Store sequences as tuples so the cached rendering can't go stale
+        object.__setattr__(self, "implementation_steps", tuple(self.implementation_steps))
+        object.__setattr__(self, "assumptions", tuple(self.assumptions))
+        object.__setattr__(self, "_rendered", None)
 
     def __str__(self):
+        # Slotted instances have no __dict__ for cached_property, so cache by hand
+        if self._rendered is None:
+            object.__setattr__(self, "_rendered", self._render())
+        return self._rendered
+
+    def _render(self) -> str:
+        """Render once; fields don't change after construction"""
         steps = '\n  '.join(f"{i+1}. {step}" for i, step in enumerate(self.implementation_steps))
         assumptions_str = '\n  - '.join(self.assumptions)
         return f"""
@@ -36,30 +110,44 @@ Assumptions:
 """
 
 
-@dataclass
-class TradeoffAnalysis:
+@dataclass(frozen=True)
+class TradeoffAnalysis(_FrozenSlots):
     """Analysis from the Reflector phase"""
+    __slots__ = ("solution_name", "performance", "maintainability", "security",
+                 "cost", "risks", "_score")
+
     solution_name: str
-    performance: str  # High/Medium/Low
-    maintainability: str
-    security: str
-    cost: str
+    # Ratings accept strings like "High"; __post_init__ coerces them to Rating
+    performance: Union[Rating, str]
+    maintainability: Union[Rating, str]
+    security: Union[Rating, str]
+    cost: Union[Rating, str]
     risks: List[str]
 
+    def __post_init__(self):
+        # Accept plain strings like "High" as well as Rating members
+        for name in ("performance", "maintainability", "security", "cost"):
+            object.__setattr__(self, name, Rating.parse(getattr(self, name)))
+
+        # Ratings never change after construction, so score once up front
+        object.__setattr__(self, "_score", (
+            int(self.performance) +
+            int(self.maintainability) +
+            int(self.security) +
+            (4 - int(self.cost))  # Lower cost is better
+        ))
+
     def score(self) -> int:
-        """Simple scoring for ranking"""
-        score_map = {"high": 3, "medium": 2, "low": 1}
-        return (
-            score_map.get(self.performance.lower(), 0) +
-            score_map.get(self.maintainability.lower(), 0) +
-            score_map.get(self.security.lower(), 0) +
-            (4 - score_map.get(self.cost.lower(), 2))  # Lower cost is better
-        )
+        """Simple scoring for ranking (computed in __post_init__)"""
+        return self._score
 
 
-@dataclass
-class CuratedRecommendation:
+@dataclass(frozen=True)
+class CuratedRecommendation(_FrozenSlots):
     """Final output from the Curator phase"""
+    __slots__ = ("primary_choice", "rationale", "alternative",
+                 "implementation_guidance", "patterns_learned")
+
     primary_choice: str
     rationale: str
     alternative: str
@@ -67,17 +155,33 @@ class CuratedRecommendation:
     patterns_learned: List[str]
 
 
+@dataclass(frozen=True)
+class _CachedCycle:
+    """
+    A completed ACE cycle, replayed when the same problem comes back
+
+    Holds private deep copies; callers only ever see copies of these, so
+    mutating a returned recommendation can't alter the cache
+    """
+    playbook: Dict  # Snapshot of the whole context playbook when the cycle finished
+    solutions: List[Solution]
+    analyses: List[TradeoffAnalysis]
+    recommendation: CuratedRecommendation
+
+
 class ACEAgent:
     """
     An agent that implements the ACE framework
     """
 
-    def __init__(self, context_playbook: Dict = None):
+    def __init__(self, context_playbook: Dict = None, task_cache_size: int = 128):
         """
         Initialize with an optional context playbook
 
         Args:
             context_playbook: Accumulated knowledge from previous iterations
+            task_cache_size: Most problems whose cycles are kept for reuse
+                (least recently used are evicted first; 0 disables caching)
         """
         self.context_playbook = context_playbook or {
             "successful_patterns": [],
@@ -88,6 +192,10 @@ class ACEAgent:
         self.solutions = []
         self.analyses = []
         self.recommendation = None
+        # Completed cycles keyed by problem text, so repeated queries skip the
+        # cycle; ordered oldest-first so it can be trimmed as an LRU
+        self._task_cache: "OrderedDict[str, _CachedCycle]" = OrderedDict()
+        self._task_cache_size = task_cache_size
 
     def generator_phase(self, problem: str) -> List[Solution]:
         """
@@ -96,16 +204,19 @@ class ACEAgent:
         In a real implementation, this would call an LLM with a generator prompt
         """
         self.current_phase = Phase.GENERATOR
-        print("=" * 60)
-        print("PHASE 1: GENERATOR - Generating Solutions")
-        print("=" * 60)
+        # Buffer the phase output and emit it with a single write
+        out = [
+            "=" * 60,
+            "PHASE 1: GENERATOR - Generating Solutions",
+            "=" * 60,
+        ]
 
         # This is a simplified example. In practice, you'd use an LLM here
         # with a prompt that includes the context playbook
 
-        print(f"\nProblem: {problem}")
-        print("\nGenerating multiple solution approaches...")
-        print("(In production: This calls LLM with Generator prompt + context playbook)")
+        out.append(f"\nProblem: {problem}")
+        out.append("\nGenerating multiple solution approaches...")
+        out.append("(In production: This calls LLM with Generator prompt + context playbook)")
 
         # Placeholder: In reality, LLM would generate these
         self.solutions = [
@@ -156,8 +267,9 @@ class ACEAgent:
             )
         ]
 
-        for solution in self.solutions:
-            print(solution)
+        out.extend(str(solution) for solution in self.solutions)
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
 
         return self.solutions
 
@@ -168,20 +280,22 @@ class ACEAgent:
         In a real implementation, this would call an LLM with a reflector prompt
         """
         self.current_phase = Phase.REFLECTOR
-        print("\n" + "=" * 60)
-        print("PHASE 2: REFLECTOR - Analyzing Trade-offs")
-        print("=" * 60)
+        out = [
+            "\n" + "=" * 60,
+            "PHASE 2: REFLECTOR - Analyzing Trade-offs",
+            "=" * 60,
+        ]
 
-        print("\n(In production: This calls LLM with Reflector prompt + solutions)")
+        out.append("\n(In production: This calls LLM with Reflector prompt + solutions)")
 
         # Placeholder: In reality, LLM would analyze these
         self.analyses = [
             TradeoffAnalysis(
                 solution_name="Solution A",
-                performance="High",
-                maintainability="Medium",
-                security="Medium",
-                cost="Low",
+                performance=Rating.HIGH,
+                maintainability=Rating.MEDIUM,
+                security=Rating.MEDIUM,
+                cost=Rating.LOW,
                 risks=[
                     "Tasks lost on server restart",
                     "No built-in retry mechanism",
@@ -190,10 +304,10 @@ class ACEAgent:
             ),
             TradeoffAnalysis(
                 solution_name="Solution B",
-                performance="High",
-                maintainability="High",
-                security="High",
-                cost="Medium",
+                performance=Rating.HIGH,
+                maintainability=Rating.HIGH,
+                security=Rating.HIGH,
+                cost=Rating.MEDIUM,
                 risks=[
                     "Redis becomes single point of failure",
                     "Need to manage Redis infrastructure",
@@ -202,10 +316,10 @@ class ACEAgent:
             ),
             TradeoffAnalysis(
                 solution_name="Solution C",
-                performance="Medium",
-                maintainability="High",
-                security="High",
-                cost="High",
+                performance=Rating.MEDIUM,
+                maintainability=Rating.HIGH,
+                security=Rating.HIGH,
+                cost=Rating.HIGH,
                 risks=[
                     "Vendor lock-in",
                     "Cold start latency for serverless",
@@ -214,19 +328,22 @@ class ACEAgent:
             )
         ]
 
-        print("\n### Trade-off Matrix")
-        print(f"{'Solution':<15} {'Perf':<8} {'Maintain':<10} {'Security':<10} {'Cost':<8} {'Score':<6}")
-        print("-" * 70)
-        for analysis in self.analyses:
-            print(f"{analysis.solution_name:<15} {analysis.performance:<8} "
-                  f"{analysis.maintainability:<10} {analysis.security:<10} "
-                  f"{analysis.cost:<8} {analysis.score():<6}")
+        out.append("\n### Trade-off Matrix")
+        out.append(_ROW_FMT("Solution", "Perf", "Maintain", "Security", "Cost", "Score"))
+        out.append("-" * 70)
+        out.extend(
+            _ROW_FMT(a.solution_name, a.performance.label, a.maintainability.label,
+                     a.security.label, a.cost.label, a.score())
+            for a in self.analyses
+        )
 
-        print("\n### Risk Assessment")
+        out.append("\n### Risk Assessment")
         for analysis in self.analyses:
-            print(f"\n{analysis.solution_name} Risks:")
-            for risk in analysis.risks:
-                print(f"  - {risk}")
+            out.append(f"\n{analysis.solution_name} Risks:")
+            out.extend(f"  - {risk}" for risk in analysis.risks)
+
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
 
         return self.analyses
 
@@ -238,17 +355,23 @@ class ACEAgent:
         In a real implementation, this would call an LLM with a curator prompt
         """
         self.current_phase = Phase.CURATOR
-        print("\n" + "=" * 60)
-        print("PHASE 3: CURATOR - Synthesizing Recommendation")
-        print("=" * 60)
+        out = [
+            "\n" + "=" * 60,
+            "PHASE 3: CURATOR - Synthesizing Recommendation",
+            "=" * 60,
+        ]
+
+        out.append("\n(In production: This calls LLM with Curator prompt + solutions + analyses)")
 
-        print("\n(In production: This calls LLM with Curator prompt + solutions + analyses)")
+        if len(solutions) < 2 or len(analyses) < 2:
+            raise ValueError("Curator phase needs at least two analyzed solutions")
 
-        # Rank solutions by score
-        ranked = sorted(
+        # Only the top two are used, so skip sorting the full list; the key
+        # reads the score precomputed in __post_init__ without a method call
+        ranked = heapq.nlargest(
+            2,
             zip(solutions, analyses),
-            key=lambda x: x[1].score(),
-            reverse=True
+            key=lambda pair: pair[1]._score
         )
 
         best_solution, best_analysis = ranked[0]
@@ -256,11 +379,11 @@ class ACEAgent:
 
         self.recommendation = CuratedRecommendation(
             primary_choice=best_solution.name,
-            rationale=f"Best balance of {best_analysis.performance.lower()} performance, "
-                     f"{best_analysis.maintainability.lower()} maintainability, and "
-                     f"{best_analysis.cost.lower()} cost",
+            rationale=f"Best balance of {best_analysis.performance.name.lower()} performance, "
+                     f"{best_analysis.maintainability.name.lower()} maintainability, and "
+                     f"{best_analysis.cost.name.lower()} cost",
             alternative=f"{second_best_solution.name} - Use if you need "
-                       f"{second_best_analysis.security.lower()} security",
+                       f"{second_best_analysis.security.name.lower()} security",
             implementation_guidance=[
                 f"Start with: {best_solution.implementation_steps[0]}",
                 f"Monitor for: Task processing latency, queue depth",
@@ -273,31 +396,48 @@ class ACEAgent:
             ]
         )
 
-        print(f"\n### Recommendation")
-        print(f"**Primary Choice:** {self.recommendation.primary_choice}")
-        print(f"**Rationale:** {self.recommendation.rationale}")
-        print(f"\n**Alternative:** {self.recommendation.alternative}")
+        out.append(f"\n### Recommendation")
+        out.append(f"**Primary Choice:** {self.recommendation.primary_choice}")
+        out.append(f"**Rationale:** {self.recommendation.rationale}")
+        out.append(f"\n**Alternative:** {self.recommendation.alternative}")
 
-        print(f"\n### Implementation Guidance")
-        for guidance in self.recommendation.implementation_guidance:
-            print(f"  - {guidance}")
+        out.append(f"\n### Implementation Guidance")
+        out.extend(f"  - {guidance}" for guidance in self.recommendation.implementation_guidance)
 
-        print(f"\n### Patterns Learned (Delta Updates to Playbook)")
+        out.append(f"\n### Patterns Learned (Delta Updates to Playbook)")
+        # Index the live list each cycle; the playbook may be edited outside the agent
+        successful_patterns = self.context_playbook["successful_patterns"]
+        known_patterns = set(successful_patterns)
         for pattern in self.recommendation.patterns_learned:
-            print(f"  - {pattern}")
+            out.append(f"  - {pattern}")
             # Update context playbook with new patterns
-            if pattern not in self.context_playbook["successful_patterns"]:
-                self.context_playbook["successful_patterns"].append(pattern)
+            if pattern not in known_patterns:
+                known_patterns.add(pattern)
+                successful_patterns.append(pattern)
+
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
 
         return self.recommendation
 
     def process_task(self, problem: str) -> CuratedRecommendation:
         """
         Execute the complete ACE cycle: Generator -> Reflector -> Curator
+
+        Repeating a problem replays its stored cycle instead of re-running it.
+        A cached answer is frozen to the playbook at the time it was stored:
+        it is only reused while no part of the playbook has changed since then,
+        and clear_task_cache() discards all stored cycles.
         """
-        print("\n" + "🔄" * 30)
-        print("ACE FRAMEWORK EXECUTION")
-        print("🔄" * 30)
+        cached = self._task_cache.get(problem)
+        if cached is not None:
+            if cached.playbook == self.context_playbook:
+                self._task_cache.move_to_end(problem)
+                return self._replay_cycle(cached)
+            # Playbook has evolved since this answer was curated
+            del self._task_cache[problem]
+
+        print(_BANNER_START)
 
         # Phase 1: Generate solutions
         solutions = self.generator_phase(problem)
@@ -307,14 +447,47 @@ class ACEAgent:
 
         # Phase 3: Curate recommendations
         recommendation = self.curator_phase(solutions, analyses)
+        if self._task_cache_size > 0:
+            self._task_cache[problem] = _CachedCycle(
+                playbook=copy.deepcopy(self.context_playbook),
+                solutions=copy.deepcopy(solutions),
+                analyses=copy.deepcopy(analyses),
+                recommendation=copy.deepcopy(recommendation)
+            )
+            while len(self._task_cache) > self._task_cache_size:
+                self._task_cache.popitem(last=False)
 
-        print("\n" + "✅" * 30)
-        print("ACE CYCLE COMPLETE")
-        print("✅" * 30)
-        print(f"\nContext Playbook now contains {len(self.context_playbook['successful_patterns'])} patterns")
+        print(self._cycle_trailer())
 
         return recommendation
 
+    def _cycle_trailer(self) -> str:
+        """Closing banner and playbook size, shared by fresh and cached cycles"""
+        return (f"{_BANNER_END}\n\nContext Playbook now contains "
+                f"{len(self.context_playbook['successful_patterns'])} patterns")
+
+    def _replay_cycle(self, cached: _CachedCycle) -> CuratedRecommendation:
+        """Restore agent state from a cached cycle and announce the cache hit"""
+        self.solutions = copy.deepcopy(cached.solutions)
+        self.analyses = copy.deepcopy(cached.analyses)
+        self.recommendation = copy.deepcopy(cached.recommendation)
+        self.current_phase = Phase.CURATOR
+
+        out = [
+            _BANNER_START,
+            "\n(Served from cache: playbook unchanged since this problem was curated)",
+            f"**Primary Choice:** {self.recommendation.primary_choice}",
+            self._cycle_trailer(),
+        ]
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
+
+        return self.recommendation
+
+    def clear_task_cache(self):
+        """Forget all cached cycles so every problem is processed afresh"""
+        self._task_cache.clear()
+
     def get_context_playbook(self) -> Dict:
         """Return the accumulated context playbook"""
         return self.context_playbook